@@ -1,13 +1,13 @@
-class SendMessageError(Exception):
-    """Собственное исключение."""
+class NotSendingError(Exception):
+    """Ошибка запроса."""
     pass
 
 
-class RequestError(Exception):
-    """Ошибка запроса."""
+class SendMessageError(NotSendingError):
+    """Собственное исключение."""
     pass
 
 
-class NotSendingError(Exception):
+class RequestError(Exception):
     """Ошибка запроса."""
     pass
@@ -3,7 +3,7 @@ import os
 import sys
 
 from http import HTTPStatus
-from json.decoder import JSONDecodeError
+from random import uniform
 from time import sleep, time
 
 import requests
@@ -19,6 +19,8 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_TIME = 6 * 100
+ERROR_RETRY_TIME = 10
+REQUEST_TIMEOUT = (5, 30)
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
 
@@ -42,7 +44,7 @@ def send_message(bot, message):
             chat_id=TELEGRAM_CHAT_ID,
             text=message
         )
-        logger.info(f'Отправлено сообщение: {message}')
+        logger.info('Отправлено сообщение: %s', message)
     except telegram.TelegramError:
         raise SendMessageError('Ошибка в отправке сообщения!')
 
@@ -59,22 +61,23 @@ def get_api_answer(current_timestamp):
         'url': ENDPOINT,
         'headers': HEADERS,
         'params': {'from_date': timestamp},
+        'timeout': REQUEST_TIMEOUT,
     }
     try:
         response = requests.get(**requests_params)
-        logger.info(f'[Запрос к API] статуc (HTTP): {response.status_code}')
-        if response.status_code != HTTPStatus.OK:
-            raise SendMessageError(
-                f'[Запрос к API]'
-                f'Статус, отличный от HTTP 200:{response.status_code}'
-            )
+    except requests.RequestException as error:
+        raise RequestError(f'[Запрос к API] Ошибка запроса: {error}')
+    logger.info('[Запрос к API] статуc (HTTP): %s', response.status_code)
+    if response.status_code != HTTPStatus.OK:
+        raise RequestError(
+            f'[Запрос к API]'
+            f'Статус, отличный от HTTP 200:{response.status_code}'
+        )
+    try:
         return response.json()
-    except JSONDecodeError:
-        raise JSONDecodeError('Запрос к API вернулся не в формате JSON')
-    except Exception as error:
+    except ValueError as error:
         raise RequestError(
-            f'[Запрос к API] Статус: {response.status_code},'
-            f'Получена ошибка: {error}'
+            f'Запрос к API вернулся не в формате JSON: {error}'
         )
 
 
@@ -89,9 +92,10 @@ def check_response(response):
         raise TypeError('словарь не поступил в функцию')
     if 'homeworks' not in response:
         raise KeyError('Ключ homeworks отсутствует')
-    if not isinstance(response['homeworks'], list):
+    homeworks = response['homeworks']
+    if not isinstance(homeworks, list):
         raise TypeError('Объект homeworks не является списком')
-    return response['homeworks']
+    return homeworks
 
 
 def parse_status(homework):
@@ -108,16 +112,15 @@ def parse_status(homework):
         return message
     else:
         homework_name = homework['homework_name']
-        homework_status = homework['status']
-        if homework_status in HOMEWORK_VERDICTS:
-            verdict = HOMEWORK_VERDICTS[homework_status]
-            mes_verdict = (
-                f'Изменился статус проверки работы "{homework_name}".'
-                f'{verdict}'
-            )
-            logger.info(mes_verdict)
-            return mes_verdict
-    raise KeyError('[Статус] ошибка статуса (ключа) homework')
+        verdict = HOMEWORK_VERDICTS.get(homework['status'])
+        if verdict is None:
+            raise KeyError('[Статус] ошибка статуса (ключа) homework')
+        mes_verdict = (
+            f'Изменился статус проверки работы "{homework_name}".'
+            f'{verdict}'
+        )
+        logger.info(mes_verdict)
+        return mes_verdict
 
 
 def check_tokens():
@@ -126,7 +129,73 @@ def check_tokens():
     Если отсутствует хотя бы одна переменная окружения — функция должна
     вернуть False, иначе — True.
     """
-    return all([PRACTICUM_TOKEN, TELEGRAM_TOKEN, TELEGRAM_CHAT_ID])
+    if PRACTICUM_TOKEN and TELEGRAM_TOKEN and TELEGRAM_CHAT_ID:
+        return True
+    tokens = {
+        'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
+        'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
+        'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID,
+    }
+    missing = [name for name, value in tokens.items() if not value]
+    logger.critical('Отсутствуют переменные окружения: %s', ', '.join(missing))
+    return False
+
+
+def collect_updates(homeworks, statuses):
+    """Функция отбирает домашние работы с новым статусом.
+    Принимает список домашних работ и словарь последних
+    отправленных статусов {id работы: статус}. Возвращает
+    словарь изменившихся статусов и список сообщений для них.
+    """
+    updates = {}
+    messages = []
+    for homework in homeworks:
+        homework_id = homework['id']
+        status = homework['status']
+        if (status in HOMEWORK_VERDICTS
+                and statuses.get(homework_id) != status
+                and updates.get(homework_id) != status):
+            updates[homework_id] = status
+            messages.append(parse_status(homework))
+    return updates, messages
+
+
+def send_updates(bot, homeworks, statuses):
+    """Функция отправляет новые статусы одним сообщением.
+    Статусы записываются в словарь statuses только после
+    успешной отправки. Возвращает True, если сообщение
+    было отправлено, иначе — False.
+    """
+    updates, messages = collect_updates(homeworks, statuses)
+    if not messages:
+        return False
+    send_message(bot, '\n\n'.join(messages))
+    statuses.update(updates)
+    return True
+
+
+def report_error(bot, message):
+    """Функция отправляет в Telegram сообщение о сбое.
+    Ошибка отправки только логируется, чтобы бот продолжил
+    работу. Возвращает True, если сообщение отправлено,
+    иначе — False.
+    """
+    try:
+        send_message(bot, message)
+    except NotSendingError as error:
+        logger.error(error)
+        return False
+    return True
+
+
+def error_sleep(retry_time):
+    """Функция ждет перед повторным запросом после ошибки.
+    Пауза растет экспоненциально от ERROR_RETRY_TIME до RETRY_TIME,
+    к ней добавляется случайный разброс до 20%. Возвращает
+    паузу для следующей ошибки.
+    """
+    sleep(min(retry_time + uniform(0, retry_time * 0.2), RETRY_TIME))
+    return min(retry_time * 2, RETRY_TIME)
 
 
 def main():
@@ -136,39 +205,43 @@ def main():
     Telegram и ждет некоторое время и делает новый запрос
     """
     if not check_tokens():
-        message = 'Отсутствуют токены чата (id чата, бота или Практикума)'
-        logger.critical(message)
         sys.exit([1])
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     current_timestamp = int(time())
     status_non = None
-    status_ok = None
+    statuses = {}
+    retry_time = ERROR_RETRY_TIME
+    error_reported = False
     while True:
         try:
             response = get_api_answer(current_timestamp)
             homeworks = check_response(response)
             if len(homeworks) == 0:
-                if parse_status(homeworks) != status_non:
-                    status_non = parse_status(homeworks)
-                    send_message(bot, f'Работа не на проверке: {homeworks}')
+                message = parse_status(homeworks)
+                if message != status_non:
+                    send_message(bot, message)
+                    status_non = message
                 else:
                     logger.info('Без обновлений')
             else:
-                if homeworks[0]['status'] in HOMEWORK_VERDICTS:
-                    if homeworks[0]['status'] != status_ok:
-                        status_ok = homeworks[0]['status']
-                        parse_status(homeworks[0])
-                        send_message(bot, HOMEWORK_VERDICTS[status_ok])
-                    else:
-                        logger.info('Без обновлений')
+                if not send_updates(bot, homeworks, statuses):
+                    logger.info('Без обновлений')
         except NotSendingError as error:
             logger.error(error)
+            retry_time = error_sleep(retry_time)
         except Exception as error:
             message = f'Сбой в работе программы: {error}'
-            send_message(bot, message)
+            if not error_reported:
+                error_reported = report_error(bot, message)
             logger.error(error)
-        finally:
+            retry_time = error_sleep(retry_time)
+        else:
+            current_timestamp = response.get(
+                'current_date', current_timestamp
+            )
             sleep(RETRY_TIME)
+            retry_time = ERROR_RETRY_TIME
+            error_reported = False
 
 
 if __name__ == '__main__':
@@ -73,6 +73,44 @@ class MockTelegramBot:
         return self.random_timestamp
 
 
+class RecordingTelegramBot:
+
+    def __init__(self, failures=0, **kwargs):
+        self.failures = failures
+        self.messages = []
+
+    def send_message(self, chat_id=None, text=None, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise telegram.TelegramError('error')
+        self.messages.append(text)
+
+
+class StopMainLoop(Exception):
+    pass
+
+
+def run_main(monkeypatch, homework, bot, sleeps):
+    """Runs homework.main until it has slept `sleeps` times."""
+    slept = []
+
+    def mock_sleep(seconds):
+        slept.append(seconds)
+        if len(slept) >= sleeps:
+            raise StopMainLoop
+
+    monkeypatch.setattr(homework, 'PRACTICUM_TOKEN', 'sometoken')
+    monkeypatch.setattr(homework, 'TELEGRAM_TOKEN', '1234:abcdefg')
+    monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+    monkeypatch.setattr(telegram, 'Bot', lambda *args, **kwargs: bot)
+    monkeypatch.setattr(homework, 'sleep', mock_sleep)
+    try:
+        homework.main()
+    except StopMainLoop:
+        pass
+    return slept
+
+
 class TestHomework:
     HOMEWORK_STATUSES = {
         'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
@@ -640,3 +678,257 @@ class TestHomework:
                 f'Убедитесь, что в функции `{func_name}` обрабатываете ситуацию, '
                 'когда API возвращает код, отличный от 200'
             )
+
+    def test_api_request_exception(self, monkeypatch, current_timestamp):
+        def mock_timeout_get(*args, **kwargs):
+            raise requests.exceptions.Timeout('timed out')
+
+        monkeypatch.setattr(requests, 'get', mock_timeout_get)
+
+        import homework
+
+        func_name = 'get_api_answer'
+        try:
+            homework.get_api_answer(current_timestamp)
+        except homework.RequestError as error:
+            assert 'timed out' in str(error), (
+                f'Убедитесь, что функция `{func_name}` передает текст '
+                'ошибки запроса к API'
+            )
+        else:
+            assert False, (
+                f'Убедитесь, что в функции `{func_name}` обрабатываете '
+                'ошибки запроса к API, например таймаут'
+            )
+
+    def test_error_sleep(self, monkeypatch):
+        import homework
+
+        slept = []
+        jitter_bounds = []
+
+        def mock_uniform(a, b):
+            jitter_bounds.append((a, b))
+            return b
+
+        monkeypatch.setattr(homework, 'sleep', slept.append)
+        monkeypatch.setattr(homework, 'uniform', mock_uniform)
+
+        func_name = 'error_sleep'
+        utils.check_function(homework, func_name, 1)
+
+        retry_time = homework.ERROR_RETRY_TIME
+        next_retry_time = homework.error_sleep(retry_time)
+        assert next_retry_time == retry_time * 2, (
+            f'Убедитесь, что функция `{func_name}` удваивает паузу'
+        )
+        assert jitter_bounds[-1] == (0, retry_time * 0.2), (
+            f'Убедитесь, что функция `{func_name}` добавляет разброс '
+            'не больше 20% от паузы'
+        )
+        assert retry_time <= slept[-1] <= retry_time * 1.2, (
+            f'Убедитесь, что функция `{func_name}` ждет паузу '
+            'с разбросом не больше 20%'
+        )
+
+        next_retry_time = homework.error_sleep(homework.RETRY_TIME)
+        assert next_retry_time == homework.RETRY_TIME, (
+            f'Убедитесь, что функция `{func_name}` ограничивает паузу '
+            'значением RETRY_TIME'
+        )
+        assert slept[-1] == homework.RETRY_TIME, (
+            f'Убедитесь, что функция `{func_name}` не ждет дольше RETRY_TIME'
+        )
+
+    def test_send_updates_batches_messages(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            {'id': 2, 'homework_name': 'hw2', 'status': 'rejected'},
+        ]
+        bot = RecordingTelegramBot()
+        statuses = {}
+
+        assert homework.send_updates(bot, homeworks, statuses)
+        assert bot.messages == [
+            homework.parse_status(homeworks[0])
+            + '\n\n'
+            + homework.parse_status(homeworks[1])
+        ], (
+            'Убедитесь, что все новые статусы отправляются одним сообщением'
+        )
+        assert statuses == {1: 'approved', 2: 'rejected'}
+
+    def test_send_updates_skips_unchanged_status(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw1', 'status': 'approved'},
+            {'id': 2, 'homework_name': 'hw2', 'status': 'reviewing'},
+        ]
+        bot = RecordingTelegramBot()
+        statuses = {1: 'approved'}
+
+        assert homework.send_updates(bot, homeworks, statuses)
+        assert bot.messages == [homework.parse_status(homeworks[1])], (
+            'Убедитесь, что неизменившийся статус не отправляется повторно'
+        )
+
+        assert not homework.send_updates(bot, homeworks, statuses)
+        assert len(bot.messages) == 1
+
+    def test_send_updates_skips_unknown_status(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw1', 'status': 'unknown'},
+            {'id': 2, 'homework_name': 'hw2', 'status': 'approved'},
+        ]
+        bot = RecordingTelegramBot()
+        statuses = {}
+
+        assert homework.send_updates(bot, homeworks, statuses)
+        assert bot.messages == [homework.parse_status(homeworks[1])], (
+            'Убедитесь, что недокументированный статус не отправляется'
+        )
+        assert statuses == {2: 'approved'}
+
+    def test_send_updates_keeps_statuses_on_send_error(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        homeworks = [{'id': 1, 'homework_name': 'hw1', 'status': 'approved'}]
+        bot = RecordingTelegramBot(failures=1)
+        statuses = {1: 'reviewing'}
+
+        try:
+            homework.send_updates(bot, homeworks, statuses)
+        except homework.SendMessageError:
+            pass
+        else:
+            assert False, (
+                'Убедитесь, что ошибка отправки сообщения не замалчивается'
+            )
+        assert statuses == {1: 'reviewing'}, (
+            'Убедитесь, что статусы не запоминаются, если сообщение '
+            'не было отправлено'
+        )
+
+    def test_send_updates_keys_on_homework_id(self, monkeypatch):
+        import homework
+
+        monkeypatch.setattr(homework, 'TELEGRAM_CHAT_ID', 12345)
+        homeworks = [
+            {'id': 1, 'homework_name': 'hw1', 'status': 'rejected'},
+            {'id': 2, 'homework_name': 'hw1', 'status': 'approved'},
+            {'id': 2, 'homework_name': 'hw1', 'status': 'approved'},
+        ]
+        bot = RecordingTelegramBot()
+        statuses = {}
+
+        assert homework.send_updates(bot, homeworks, statuses)
+        assert bot.messages == [
+            homework.parse_status(homeworks[0])
+            + '\n\n'
+            + homework.parse_status(homeworks[1])
+        ], (
+            'Убедитесь, что работы с одинаковым названием различаются по id, '
+            'а повторы в одном ответе отправляются один раз'
+        )
+        assert statuses == {1: 'rejected', 2: 'approved'}
+
+    def test_main_reports_repeated_error_once(self, monkeypatch):
+        def mock_connection_error_get(*args, **kwargs):
+            raise requests.exceptions.ConnectionError(object())
+
+        monkeypatch.setattr(requests, 'get', mock_connection_error_get)
+
+        import homework
+
+        bot = RecordingTelegramBot()
+        run_main(monkeypatch, homework, bot, sleeps=2)
+        assert len(bot.messages) == 1, (
+            'Убедитесь, что при повторяющейся ошибке сообщение о сбое '
+            'отправляется только один раз'
+        )
+
+    def test_main_retries_failed_send(self, monkeypatch):
+        import homework
+
+        test_homework = {
+            'id': 1, 'homework_name': 'hw1', 'status': 'approved'
+        }
+        requested = []
+
+        def mock_get_api_answer(current_timestamp):
+            requested.append(current_timestamp)
+            return {
+                'homeworks': [test_homework],
+                'current_date': current_timestamp + 600,
+            }
+
+        monkeypatch.setattr(homework, 'get_api_answer', mock_get_api_answer)
+
+        bot = RecordingTelegramBot(failures=1)
+        run_main(monkeypatch, homework, bot, sleeps=2)
+        assert bot.messages == [homework.parse_status(test_homework)], (
+            'Убедитесь, что статус отправляется повторно после '
+            'неудачной отправки сообщения'
+        )
+        assert len(requested) == 2 and requested[0] == requested[1], (
+            'Убедитесь, что `from_date` не сдвигается, '
+            'пока сообщение не отправлено'
+        )
+
+    def test_api_answer_not_json(self, monkeypatch, random_timestamp,
+                                 current_timestamp):
+        def mock_not_json_response_get(*args, **kwargs):
+            response = MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                current_timestamp=current_timestamp, **kwargs
+            )
+
+            def json_invalid():
+                raise ValueError('Expecting value')
+
+            response.json = json_invalid
+            return response
+
+        monkeypatch.setattr(requests, 'get', mock_not_json_response_get)
+
+        import homework
+
+        func_name = 'get_api_answer'
+        try:
+            homework.get_api_answer(current_timestamp)
+        except homework.RequestError as error:
+            assert 'Expecting value' in str(error), (
+                f'Убедитесь, что функция `{func_name}` передает текст '
+                'ошибки разбора JSON'
+            )
+        else:
+            assert False, (
+                f'Убедитесь, что в функции `{func_name}` обрабатываете '
+                'ответ API не в формате JSON'
+            )
+
+    def test_api_invalid_url(self, monkeypatch, current_timestamp):
+        def mock_invalid_url_get(*args, **kwargs):
+            raise requests.exceptions.InvalidURL('bad url')
+
+        monkeypatch.setattr(requests, 'get', mock_invalid_url_get)
+
+        import homework
+
+        try:
+            homework.get_api_answer(current_timestamp)
+        except homework.RequestError as error:
+            assert 'JSON' not in str(error) and 'bad url' in str(error), (
+                'Убедитесь, что ошибка запроса не выдается за ошибку JSON'
+            )
+        else:
+            assert False